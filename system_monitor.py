@@ -4,6 +4,8 @@ process monitoring, and network traffic inspection.
 """
 
 import time
+import heapq
+import operator
 import psutil
 import click
 from rich.console import Console
@@ -12,28 +14,372 @@ from rich.layout import Layout
 from rich.panel import Panel
 from rich.live import Live
 from rich.text import Text
-from collections import deque
+from array import array
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import signal
 import sys
+import os
+import threading
+import re
 
 console = Console()
 
+# Row types produced by the collectors; tuples keep per-refresh allocations small
+ProcRow = namedtuple('ProcRow', 'pid name cpu_percent memory_percent memory_mb status threads')
+DiskRow = namedtuple('DiskRow', 'device mountpoint fstype total used free percent '
+                                'read_bytes write_bytes read_count write_count')
+Partition = namedtuple('Partition', 'device mountpoint fstype')
+NetInfo = namedtuple('NetInfo', 'bytes_sent bytes_recv packets_sent packets_recv errin errout '
+                                'dropin dropout connections send_speed recv_speed')
+
+# Minimum seconds between the CPU baseline and the first published sample
+PRIME_INTERVAL = 0.25
+
+# Number of samples kept for each history series
+HISTORY_SIZE = 60
+
+# Byte units for format_bytes, indexed by power of 1024
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+# Exact reciprocals of 1024**i, so scaling is a multiply instead of a divide
+_INV_SCALE = tuple(1.0 / (1 << (i * 10)) for i in range(len(_UNITS)))
+
+# Pre-built (full, empty) bar strings per width, sliced by format_percent_bar
+_BAR_WIDTH = 20
+_BARS = {_BAR_WIDTH: ("█" * _BAR_WIDTH, "░" * _BAR_WIDTH)}
+
+# Row colors indexed by how many thresholds a value exceeds
+_COLOR_LUT = ("green", "yellow", "red")
+
+# Linux /proc/<pid>/stat decoding, used by SystemMonitor._linux_fast_procs
+if sys.platform.startswith('linux'):
+    _CLK_TCK = os.sysconf('SC_CLK_TCK')
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+# Kernel TASK_COMM_LEN minus the trailing NUL
+_COMM_LEN = 15
+_PROC_STATUSES = {
+    b'R': 'running',
+    b'S': 'sleeping',
+    b'D': 'disk-sleep',
+    b'T': 'stopped',
+    b't': 'tracing-stop',
+    b'Z': 'zombie',
+    b'X': 'dead',
+    b'x': 'dead',
+    b'K': 'wake-kill',
+    b'W': 'waking',
+    b'I': 'idle',
+    b'P': 'parked',
+}
+
+
+def _parse_proc_stat(data: bytes) -> Optional[Tuple[str, bytes, int, int, int]]:
+    """Parse a /proc/<pid>/stat buffer into (name, state, utime+stime, rss pages, threads).
+    
+    Returns None if the buffer is malformed.
+    """
+    # comm may contain spaces or parentheses, so split on the last ')'
+    lparen = data.find(b'(')
+    rparen = data.rfind(b')')
+    if lparen < 0 or rparen < 0:
+        return None
+    
+    # Fields after comm, starting at field 3 (state) of proc(5); stop
+    # splitting once rss (field 24) is reached
+    fields = data[rparen + 2:].split(None, 22)
+    if len(fields) < 22:
+        return None
+    return (
+        data[lparen + 1:rparen].decode('utf-8', 'replace'),
+        fields[0],
+        int(fields[11]) + int(fields[12]),
+        int(fields[21]),
+        int(fields[17]),
+    )
+
+
+def _linux_full_name(pid: str, comm: str) -> str:
+    """Extend a truncated ``comm`` from /proc/<pid>/cmdline, as psutil's name() does."""
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            data = f.read().decode('utf-8', 'replace')
+    except OSError:
+        return comm
+    if not data:
+        return comm
+    # Same rule as psutil's cmdline(): processes that rewrite their argv may
+    # separate arguments with spaces instead of NULs
+    sep = '\0' if data.endswith('\0') else ' '
+    if data.endswith(sep):
+        data = data[:-1]
+    args = data.split(sep)
+    if sep == '\0' and len(args) == 1 and ' ' in data:
+        args = data.split(' ')
+    extended = os.path.basename(args[0])
+    return extended if extended.startswith(comm) else comm
+
+
+def _unescape_mount_field(field: str) -> str:
+    """Decode the octal escapes (e.g. ``\\040`` for space) used in mountinfo fields."""
+    if '\\' not in field:
+        return field
+    return re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _linux_block_device(majmin: str) -> Optional[str]:
+    """Resolve a ``major:minor`` pair to its /dev path, or None if unknown."""
+    try:
+        with open(f"/sys/dev/block/{majmin}/uevent") as f:
+            for line in f:
+                if line.startswith('DEVNAME='):
+                    return '/dev/' + line.strip()[len('DEVNAME='):]
+    except OSError:
+        pass
+    # Fall back to /proc/partitions ("major minor #blocks name")
+    major, _, minor = majmin.partition(':')
+    try:
+        with open('/proc/partitions') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 4 and fields[0] == major and fields[1] == minor:
+                    return '/dev/' + fields[3]
+    except OSError:
+        pass
+    return None
+
+
+def _linux_disk_partitions() -> List[Partition]:
+    """List physical mounts from a single /proc/self/mountinfo read.
+    
+    Mirrors ``psutil.disk_partitions(all=False)``: only mounts with a source
+    device and a filesystem type not flagged ``nodev`` (plus zfs) are kept,
+    and ``/dev/root``/``rootfs`` are mapped to the real block device.
+    """
+    fstypes = set()
+    with open('/proc/filesystems') as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] != 'nodev':
+                fstypes.add(fields[0])
+            elif fields[1:] == ['zfs']:
+                fstypes.add('zfs')
+    with open('/proc/self/mountinfo') as f:
+        lines = f.read().splitlines()
+    
+    partitions = []
+    for line in lines:
+        # "<id> <parent> <maj:min> <root> <mountpoint> <opts> [optional...] - <fstype> <source> <superopts>"
+        pre, sep, post = line.partition(' - ')
+        if not sep:
+            continue
+        pre_fields = pre.split()
+        post_fields = post.split()
+        if len(pre_fields) < 5 or len(post_fields) < 2:
+            continue
+        fstype, device = post_fields[0], post_fields[1]
+        if device == 'none' or fstype not in fstypes:
+            continue
+        if device in ('/dev/root', 'rootfs'):
+            device = _linux_block_device(pre_fields[2]) or device
+        partitions.append(Partition(_unescape_mount_field(device),
+                                    _unescape_mount_field(pre_fields[4]), fstype))
+    return partitions
+
+
+class _RingBuffer:
+    """Fixed-size float history backed by a flat array and a write index."""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._values = array('f', bytes(4 * size))
+        self._count = 0
+    
+    def append(self, value: float):
+        self._values[self._count % self.size] = value
+        self._count += 1
+    
+    def __len__(self) -> int:
+        return min(self._count, self.size)
+    
+    def latest_view(self) -> List[float]:
+        """Return the stored samples oldest-first; only needed when rendering."""
+        if self._count <= self.size:
+            return self._values[:self._count].tolist()
+        start = self._count % self.size
+        return (self._values[start:] + self._values[:start]).tolist()
+
+
+class _Sampler:
+    """Runs each collector on its own thread and publishes the latest results.
+    
+    The render loop only reads the published snapshot, so a slow collector
+    (e.g. ``net_connections`` on a busy host) delays its own data instead of
+    the whole frame.
+    """
+    
+    # Slow-moving data is sampled less often than the refresh rate
+    CONNECTION_PERIOD = 2.0
+    DISK_PERIOD = 5.0
+    # Upper bound on how long stop() waits for collectors to finish
+    STOP_TIMEOUT = 1.0
+    
+    def __init__(self, monitor: 'SystemMonitor', sort_by: str, process_limit: int,
+                 connection_limit: int, filter_process: Optional[str]):
+        self.monitor = monitor
+        self.sort_by = sort_by
+        self.process_limit = process_limit
+        self.connection_limit = connection_limit
+        self.filter_process = filter_process
+        self._snapshot = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        # Set by a collector thread that died on an unexpected exception
+        self.error = None
+        
+        refresh = monitor.refresh_rate
+        self._collectors = [
+            (self._sample_cpu, refresh),
+            (self._sample_memory, refresh),
+            (self._sample_processes, refresh),
+            (self._sample_network, refresh),
+            (self._sample_disks, max(refresh, self.DISK_PERIOD)),
+        ]
+        if monitor.collect_connections:
+            if monitor.connection_interval:
+                connection_period = refresh * monitor.connection_interval
+            else:
+                connection_period = max(refresh, self.CONNECTION_PERIOD)
+            self._collectors.insert(3, (self._sample_connections, connection_period))
+        else:
+            # Never sampled; the network helpers treat None as "disabled"
+            self._snapshot.update(raw_connections=None, connections=[])
+    
+    def _publish(self, **values):
+        with self._lock:
+            self._snapshot.update(values)
+    
+    def _sample_cpu(self):
+        cpu_info = self.monitor.get_cpu_info()
+        self.monitor.cpu_history.append(cpu_info['percent'])
+        self._publish(cpu_info=cpu_info)
+    
+    def _sample_memory(self):
+        mem_info = self.monitor.get_memory_info()
+        self.monitor.memory_history.append(mem_info['percent'])
+        self._publish(mem_info=mem_info)
+    
+    def _sample_processes(self):
+        processes = self.monitor.get_top_processes(limit=self.process_limit, sort_by=self.sort_by,
+                                                   filter_name=self.filter_process)
+        self._publish(processes=processes)
+    
+    def _sample_connections(self):
+        raw_connections = self.monitor.get_connections_snapshot()
+        connections = self.monitor.get_network_connections(raw_connections, limit=self.connection_limit)
+        self._publish(raw_connections=raw_connections, connections=connections)
+    
+    def _sample_network(self):
+        with self._lock:
+            raw_connections = self._snapshot.get('raw_connections')
+        self._publish(net_info=self.monitor.get_network_info(raw_connections))
+    
+    def _sample_disks(self):
+        self._publish(disks=self.monitor.get_disk_info())
+    
+    def _sample(self, collector):
+        try:
+            collector()
+        except (psutil.Error, OSError) as e:
+            # Keep the previous sample and try again next period
+            console.print(f"[dim red]Error: {e}[/dim red]")
+    
+    def _loop(self, collector, period: float):
+        while not self._stop.wait(period):
+            try:
+                self._sample(collector)
+            except Exception as e:
+                # Unexpected failure: hand it to the render loop to re-raise
+                self.error = e
+                return
+    
+    def start(self):
+        """Take one sample of everything, then start the collector threads."""
+        # CPU figures are deltas against the baseline taken in SystemMonitor.__init__;
+        # give them a measurable window so the first frame shows real usage
+        remaining = self.monitor._primed_at + PRIME_INTERVAL - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        for collector, _ in self._collectors:
+            self._sample(collector)
+        for collector, period in self._collectors:
+            thread = threading.Thread(target=self._loop, args=(collector, period), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self):
+        """Signal the collector threads to exit and wait briefly for them.
+        
+        The threads are daemons, so one stuck in a slow call (e.g. a stalled
+        ``net_connections``) is abandoned after ``STOP_TIMEOUT`` seconds.
+        """
+        self._stop.set()
+        deadline = time.monotonic() + self.STOP_TIMEOUT
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+    
+    def snapshot(self) -> Dict:
+        """Return a copy of the latest published samples."""
+        with self._lock:
+            return dict(self._snapshot)
+
 
 class SystemMonitor:
     """Main system monitoring class with real-time data collection."""
     
-    def __init__(self, refresh_rate: float = 1.0):
+    def __init__(self, refresh_rate: float = 1.0, collect_connections: bool = True,
+                 connection_interval: Optional[int] = None):
         self.refresh_rate = refresh_rate
+        # net_connections is the costliest collector; it can be slowed down or skipped
+        self.collect_connections = collect_connections
+        self.connection_interval = connection_interval
         self.running = True
-        self.cpu_history = deque(maxlen=60)
-        self.memory_history = deque(maxlen=60)
-        self.network_history = deque(maxlen=60)
+        self.cpu_history = _RingBuffer(HISTORY_SIZE)
+        self.memory_history = _RingBuffer(HISTORY_SIZE)
+        self.network_history = _RingBuffer(HISTORY_SIZE)
         self.process_cache = {}
+        self._mem_total = psutil.virtual_memory().total
         self.last_net_io = None
         self.last_net_time = None
-        
+        self.layout = None
+        self._render_keys = {}
+        self._wakeup = threading.Event()
+        # Titles are styled once here so Rich skips markup parsing every frame
+        self._system_title = Text("System Overview", style="bold cyan")
+        self._proc_title = Text("Top Processes", style="bold yellow")
+        self._net_title = Text("Network Statistics", style="bold green")
+        self._conn_title = Text("Active Network Connections", style="bold blue")
+        self._disk_title = Text("Disk Usage", style="bold magenta")
+        self._prime_cpu_counters()
+        
+    def _prime_cpu_counters(self):
+        """Take the baseline CPU samples so the first refresh already reports real usage."""
+        psutil.cpu_percent(interval=None, percpu=True)
+        if sys.platform.startswith('linux'):
+            # Fills process_cache with the tick baseline for every PID
+            self._linux_fast_procs()
+        else:
+            # process_iter keeps these Process objects, so later calls compare against this sample
+            for proc in psutil.process_iter():
+                try:
+                    proc.cpu_percent(interval=None)
+                except psutil.Error:
+                    continue
+        self._primed_at = time.monotonic()
+    
     def get_cpu_info(self) -> Dict:
         """Get comprehensive CPU information."""
         cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
@@ -63,39 +409,41 @@ class SystemMonitor:
             'swap_percent': swap.percent
         }
     
-    def get_disk_info(self) -> List[Dict]:
+    def get_disk_info(self) -> List[DiskRow]:
         """Get disk usage information for all partitions."""
         disks = []
-        partitions = psutil.disk_partitions()
+        if sys.platform.startswith('linux'):
+            partitions = _linux_disk_partitions()
+        else:
+            partitions = psutil.disk_partitions()
+        io_map = psutil.disk_io_counters(perdisk=True) or {}
         
         for partition in partitions:
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
-                io = psutil.disk_io_counters(perdisk=True).get(partition.device.replace('\\', ''), None)
+                io = io_map.get(partition.device.replace('\\', ''))
                 
-                disk_info = {
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent,
-                    'read_bytes': io.read_bytes if io else 0,
-                    'write_bytes': io.write_bytes if io else 0,
-                    'read_count': io.read_count if io else 0,
-                    'write_count': io.write_count if io else 0
-                }
-                disks.append(disk_info)
+                disks.append(DiskRow(
+                    device=partition.device,
+                    mountpoint=partition.mountpoint,
+                    fstype=partition.fstype,
+                    total=usage.total,
+                    used=usage.used,
+                    free=usage.free,
+                    percent=usage.percent,
+                    read_bytes=io.read_bytes if io else 0,
+                    write_bytes=io.write_bytes if io else 0,
+                    read_count=io.read_count if io else 0,
+                    write_count=io.write_count if io else 0
+                ))
             except PermissionError:
                 continue
         
         return disks
     
-    def get_network_info(self) -> Dict:
+    def get_network_info(self, connections: Optional[List]) -> NetInfo:
         """Get network statistics with speed calculation."""
         net_io = psutil.net_io_counters()
-        connections = psutil.net_connections(kind='inet')
         current_time = time.time()
         
         # Calculate network speed
@@ -110,101 +458,179 @@ class SystemMonitor:
         self.last_net_io = net_io
         self.last_net_time = current_time
         
-        return {
-            'bytes_sent': net_io.bytes_sent,
-            'bytes_recv': net_io.bytes_recv,
-            'packets_sent': net_io.packets_sent,
-            'packets_recv': net_io.packets_recv,
-            'errin': net_io.errin,
-            'errout': net_io.errout,
-            'dropin': net_io.dropin,
-            'dropout': net_io.dropout,
-            'connections': len(connections),
-            'send_speed': send_speed,
-            'recv_speed': recv_speed
-        }
+        return NetInfo(
+            bytes_sent=net_io.bytes_sent,
+            bytes_recv=net_io.bytes_recv,
+            packets_sent=net_io.packets_sent,
+            packets_recv=net_io.packets_recv,
+            errin=net_io.errin,
+            errout=net_io.errout,
+            dropin=net_io.dropin,
+            dropout=net_io.dropout,
+            connections=len(connections) if connections is not None else None,
+            send_speed=send_speed,
+            recv_speed=recv_speed
+        )
     
-    def get_top_processes(self, limit: int = 10, sort_by: str = 'cpu', filter_name: Optional[str] = None) -> List[Dict]:
+    def get_top_processes(self, limit: int = 10, sort_by: str = 'cpu', filter_name: Optional[str] = None) -> List[ProcRow]:
         """Get top processes sorted by CPU or memory usage."""
+        # Lowercase the filter once rather than for every process
+        needle = filter_name.lower() if filter_name else None
+        if sys.platform.startswith('linux'):
+            processes = self._linux_fast_procs(needle)
+        else:
+            processes = self._psutil_procs(needle)
+        
+        # Select the top processes without sorting the whole list
+        sort_key = operator.attrgetter('memory_percent' if sort_by == 'memory' else 'cpu_percent')
+        return heapq.nlargest(limit, processes, key=sort_key)
+    
+    def _psutil_procs(self, needle: Optional[str] = None) -> List[ProcRow]:
+        """Collect per-process stats through psutil (portable path).
+        
+        ``needle`` is an already-lowercased name filter.
+        """
         processes = []
         
+        # psutil >= 6.0 no longer re-checks each cached Process for PID reuse
+        # while iterating (giampaolo/psutil#2396), which makes this loop cheap.
+        # Passing attrs makes process_iter fill proc.info via as_dict(), which
+        # already wraps the reads in Process.oneshot(), so each /proc file is
+        # read at most once per process.
         for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 
-                                        'memory_info', 'status', 'create_time', 'num_threads']):
+                                        'memory_info', 'status', 'num_threads']):
             try:
                 pinfo = proc.info
-                if pinfo['cpu_percent'] is None:
-                    pinfo['cpu_percent'] = 0
-                if pinfo['memory_percent'] is None:
-                    pinfo['memory_percent'] = 0
                 
                 # Filter by process name if specified
-                if filter_name and filter_name.lower() not in pinfo['name'].lower():
+                if needle and needle not in pinfo['name'].lower():
                     continue
                 
-                processes.append({
-                    'pid': pinfo['pid'],
-                    'name': pinfo['name'],
-                    'cpu_percent': pinfo['cpu_percent'],
-                    'memory_percent': pinfo['memory_percent'],
-                    'memory_mb': pinfo['memory_info'].rss / 1024 / 1024 if pinfo['memory_info'] else 0,
-                    'status': pinfo['status'],
-                    'threads': pinfo['num_threads'],
-                    'create_time': pinfo['create_time']
-                })
+                processes.append(ProcRow(
+                    pid=pinfo['pid'],
+                    name=pinfo['name'],
+                    # None here means AccessDenied; CPU counters were primed in __init__
+                    cpu_percent=pinfo['cpu_percent'] or 0,
+                    memory_percent=pinfo['memory_percent'] or 0,
+                    memory_mb=pinfo['memory_info'].rss / 1024 / 1024 if pinfo['memory_info'] else 0,
+                    status=pinfo['status'],
+                    threads=pinfo['num_threads']
+                ))
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
         
-        # Sort processes
-        if sort_by == 'cpu':
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-        elif sort_by == 'memory':
-            processes.sort(key=lambda x: x['memory_percent'], reverse=True)
-        
-        return processes[:limit]
+        return processes
     
-    def get_network_connections(self, limit: int = 20) -> List[Dict]:
-        """Get active network connections."""
-        connections = []
+    def _linux_fast_procs(self, needle: Optional[str] = None) -> List[ProcRow]:
+        """Collect per-process stats from a single /proc/<pid>/stat read per PID.
+        
+        psutil opens several /proc files per process for the attributes we
+        display; apart from names longer than the kernel's 15-character
+        ``comm``, which also need ``cmdline``, everything the process table
+        needs is in ``stat``. CPU usage is computed from the tick deltas kept
+        in ``self.process_cache``. ``needle`` is an already-lowercased name filter.
+        """
+        processes = []
+        cache = {}
+        now = time.monotonic()
+        mem_total = self._mem_total
         
-        try:
-            for conn in psutil.net_connections(kind='inet'):
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
                 try:
-                    conn_info = {
-                        'fd': conn.fd,
-                        'family': str(conn.family),
-                        'type': str(conn.type),
-                        'laddr': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
-                        'raddr': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
-                        'status': conn.status,
-                        'pid': conn.pid
-                    }
-                    connections.append(conn_info)
-                except (AttributeError, ValueError):
+                    fd = os.open(f"/proc/{entry.name}/stat", os.O_RDONLY)
+                    try:
+                        data = os.read(fd, 4096)
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    # Process exited between listing and reading
                     continue
+                
+                parsed = _parse_proc_stat(data)
+                if parsed is None:
+                    continue
+                name, state, ticks, rss_pages, num_threads = parsed
+                pid = int(entry.name)
+                prev = self.process_cache.get(pid)
+                
+                # comm is truncated by the kernel; recover the full name the way
+                # psutil does, reusing the last lookup while the PID keeps its comm
+                if len(name) >= _COMM_LEN:
+                    if prev is not None and prev[2].startswith(name):
+                        name = prev[2]
+                    else:
+                        name = _linux_full_name(entry.name, name)
+                
+                # Filter by process name if specified
+                if needle and needle not in name.lower():
+                    continue
+                
+                rss = rss_pages * _PAGE_SIZE
+                
+                cpu_percent = 0.0
+                if prev is not None and now > prev[1]:
+                    cpu_percent = (ticks - prev[0]) / _CLK_TCK / (now - prev[1]) * 100
+                cache[pid] = (ticks, now, name)
+                
+                processes.append(ProcRow(
+                    pid=pid,
+                    name=name,
+                    cpu_percent=cpu_percent,
+                    memory_percent=rss / mem_total * 100 if mem_total else 0,
+                    memory_mb=rss / 1024 / 1024,
+                    status=_PROC_STATUSES.get(state, '?'),
+                    threads=num_threads
+                ))
+        
+        # Drop entries for processes that have exited
+        self.process_cache = cache
+        return processes
+    
+    def get_connections_snapshot(self) -> List:
+        """Get the raw inet connection list, shared by the network helpers each refresh."""
+        try:
+            return psutil.net_connections(kind='inet')
         except (psutil.AccessDenied, PermissionError):
-            pass
+            return []
+    
+    def get_network_connections(self, raw_connections: List, limit: int = 20) -> List[Dict]:
+        """Get active network connections."""
+        connections = []
+        
+        for conn in raw_connections:
+            try:
+                conn_info = {
+                    'fd': conn.fd,
+                    'family': str(conn.family),
+                    'type': str(conn.type),
+                    'laddr': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
+                    'raddr': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
+                    'status': conn.status,
+                    'pid': conn.pid
+                }
+                connections.append(conn_info)
+            except (AttributeError, ValueError):
+                continue
         
         return connections[:limit]
     
     def format_bytes(self, bytes_value: int) -> str:
         """Format bytes to human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+        # Pick the unit from the bit length: each unit step is 2**10
+        exp = min(5, (int(bytes_value).bit_length() - 1) // 10) if bytes_value >= 1 else 0
+        return "%.2f %s" % (bytes_value * _INV_SCALE[exp], _UNITS[exp])
     
-    def format_percent_bar(self, percent: float, width: int = 20) -> Text:
+    def format_percent_bar(self, percent: float, width: int = _BAR_WIDTH) -> Text:
         """Create a visual percent bar."""
         filled = int(width * percent / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        
-        if percent < 50:
-            color = "green"
-        elif percent < 80:
-            color = "yellow"
-        else:
-            color = "red"
+        bars = _BARS.get(width)
+        if bars is None:
+            bars = _BARS[width] = ("█" * width, "░" * width)
+        bar = bars[0][:filled] + bars[1][:width - filled]
+        color = _COLOR_LUT[(percent >= 50) + (percent >= 80)]
         
         return Text(f"{bar} {percent:.1f}%", style=color)
     
@@ -232,11 +658,11 @@ class SystemMonitor:
             table.add_row("Swap:", self.format_percent_bar(mem_info['swap_percent']))
             table.add_row("Swap Used:", f"{self.format_bytes(mem_info['swap_used'])} / {self.format_bytes(mem_info['swap_total'])}")
         
-        return Panel(table, title="[bold cyan]System Overview[/bold cyan]", border_style="cyan")
+        return Panel(table, title=self._system_title, border_style="cyan")
     
-    def create_process_table(self, processes: List[Dict]) -> Table:
+    def create_process_table(self, processes: List[ProcRow]) -> Table:
         """Create process monitoring table."""
-        table = Table(title="[bold yellow]Top Processes[/bold yellow]", show_header=True, header_style="bold yellow")
+        table = Table(title=self._proc_title, show_header=True, header_style="bold yellow")
         table.add_column("PID", style="cyan", width=8)
         table.add_column("Name", style="green", width=20, overflow="ellipsis")
         table.add_column("CPU %", style="yellow", justify="right", width=10)
@@ -246,42 +672,45 @@ class SystemMonitor:
         table.add_column("Status", style="white", width=10)
         
         for proc in processes:
-            cpu_color = "red" if proc['cpu_percent'] > 50 else "yellow" if proc['cpu_percent'] > 20 else "green"
-            mem_color = "red" if proc['memory_percent'] > 50 else "yellow" if proc['memory_percent'] > 20 else "green"
+            cpu_color = _COLOR_LUT[(proc.cpu_percent > 20) + (proc.cpu_percent > 50)]
+            mem_color = _COLOR_LUT[(proc.memory_percent > 20) + (proc.memory_percent > 50)]
             
             table.add_row(
-                str(proc['pid']),
-                proc['name'][:20],
-                f"[{cpu_color}]{proc['cpu_percent']:.1f}%[/{cpu_color}]",
-                f"[{mem_color}]{proc['memory_percent']:.1f}%[/{mem_color}]",
-                f"{proc['memory_mb']:.1f}",
-                str(proc['threads']),
-                proc['status']
+                str(proc.pid),
+                proc.name[:20],
+                f"[{cpu_color}]{proc.cpu_percent:.1f}%[/{cpu_color}]",
+                f"[{mem_color}]{proc.memory_percent:.1f}%[/{mem_color}]",
+                f"{proc.memory_mb:.1f}",
+                str(proc.threads),
+                proc.status
             )
         
         return table
     
-    def create_network_table(self, net_info: Dict, connections: List[Dict]) -> Table:
+    def create_network_table(self, net_info: NetInfo, connections: List[Dict]) -> Table:
         """Create network information table."""
-        table = Table(title="[bold green]Network Statistics[/bold green]", show_header=True, header_style="bold green")
+        table = Table(title=self._net_title, show_header=True, header_style="bold green")
         table.add_column("Metric", style="cyan", width=20)
         table.add_column("Value", style="white", width=25)
         
-        table.add_row("Bytes Sent", self.format_bytes(net_info['bytes_sent']))
-        table.add_row("Bytes Received", self.format_bytes(net_info['bytes_recv']))
-        table.add_row("Send Speed", f"{self.format_bytes(net_info['send_speed'])}/s")
-        table.add_row("Recv Speed", f"{self.format_bytes(net_info['recv_speed'])}/s")
-        table.add_row("Packets Sent", f"{net_info['packets_sent']:,}")
-        table.add_row("Packets Received", f"{net_info['packets_recv']:,}")
-        table.add_row("Errors In", f"{net_info['errin']:,}")
-        table.add_row("Errors Out", f"{net_info['errout']:,}")
-        table.add_row("Active Connections", f"{net_info['connections']:,}")
+        table.add_row("Bytes Sent", self.format_bytes(net_info.bytes_sent))
+        table.add_row("Bytes Received", self.format_bytes(net_info.bytes_recv))
+        table.add_row("Send Speed", f"{self.format_bytes(net_info.send_speed)}/s")
+        table.add_row("Recv Speed", f"{self.format_bytes(net_info.recv_speed)}/s")
+        table.add_row("Packets Sent", f"{net_info.packets_sent:,}")
+        table.add_row("Packets Received", f"{net_info.packets_recv:,}")
+        table.add_row("Errors In", f"{net_info.errin:,}")
+        table.add_row("Errors Out", f"{net_info.errout:,}")
+        if net_info.connections is None:
+            table.add_row("Active Connections", "[dim]disabled[/dim]")
+        else:
+            table.add_row("Active Connections", f"{net_info.connections:,}")
         
         return table
     
     def create_connections_table(self, connections: List[Dict]) -> Table:
         """Create network connections table."""
-        table = Table(title="[bold blue]Active Network Connections[/bold blue]", show_header=True, header_style="bold blue")
+        table = Table(title=self._conn_title, show_header=True, header_style="bold blue")
         table.add_column("PID", style="cyan", width=8)
         table.add_column("Local Address", style="green", width=25)
         table.add_column("Remote Address", style="yellow", width=25)
@@ -299,9 +728,9 @@ class SystemMonitor:
         
         return table
     
-    def create_disk_table(self, disks: List[Dict]) -> Table:
+    def create_disk_table(self, disks: List[DiskRow]) -> Table:
         """Create disk usage table."""
-        table = Table(title="[bold magenta]Disk Usage[/bold magenta]", show_header=True, header_style="bold magenta")
+        table = Table(title=self._disk_title, show_header=True, header_style="bold magenta")
         table.add_column("Device", style="cyan", width=15)
         table.add_column("Mount", style="green", width=20)
         table.add_column("Type", style="white", width=10)
@@ -311,15 +740,15 @@ class SystemMonitor:
         table.add_column("Usage %", style="magenta", justify="right", width=10)
         
         for disk in disks:
-            usage_color = "red" if disk['percent'] > 80 else "yellow" if disk['percent'] > 60 else "green"
+            usage_color = _COLOR_LUT[(disk.percent > 60) + (disk.percent > 80)]
             table.add_row(
-                disk['device'],
-                disk['mountpoint'][:20],
-                disk['fstype'],
-                self.format_bytes(disk['total']),
-                self.format_bytes(disk['used']),
-                self.format_bytes(disk['free']),
-                f"[{usage_color}]{disk['percent']:.1f}%[/{usage_color}]"
+                disk.device,
+                disk.mountpoint[:20],
+                disk.fstype,
+                self.format_bytes(disk.total),
+                self.format_bytes(disk.used),
+                self.format_bytes(disk.free),
+                f"[{usage_color}]{disk.percent:.1f}%[/{usage_color}]"
             )
         
         return table
@@ -340,9 +769,8 @@ class SystemMonitor:
         
         return Panel(footer_text, border_style="dim blue", height=3)
     
-    def generate_layout(self, cpu_info: Dict, mem_info: Dict, processes: List[Dict], 
-                       net_info: Dict, connections: List[Dict], disks: List[Dict]) -> Layout:
-        """Generate the main layout for the TUI."""
+    def build_layout(self) -> Layout:
+        """Build the static layout skeleton for the TUI once; panels are filled in by the update_* methods."""
         layout = Layout()
         
         # Split into header, body, and footer
@@ -352,11 +780,6 @@ class SystemMonitor:
             Layout(name="footer", size=3)
         )
         
-        # Header with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        header_text = Text(f"🔍 System Monitor - {timestamp}", style="bold white on blue")
-        layout["header"].update(Panel(header_text, border_style="blue"))
-        
         # Split body into main content and sidebar
         layout["body"].split_row(
             Layout(name="main", ratio=2),
@@ -375,68 +798,97 @@ class SystemMonitor:
             Layout(name="disk", ratio=1)
         )
         
-        # Update all panels
-        layout["system"].update(self.create_system_panel(cpu_info, mem_info))
-        layout["processes"].update(self.create_process_table(processes))
-        layout["network"].update(self.create_network_table(net_info, connections))
-        layout["disk"].update(self.create_disk_table(disks))
+        # Footer never changes, so render it only here
         layout["footer"].update(self.create_footer())
         
         return layout
     
+    def _is_dirty(self, region: str, key) -> bool:
+        """Record ``key`` for a layout region and report whether it changed since the last render."""
+        if self._render_keys.get(region) == key:
+            return False
+        self._render_keys[region] = key
+        return True
+    
+    def update_header(self):
+        """Refresh the header timestamp."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        header_text = Text(f"🔍 System Monitor - {timestamp}", style="bold white on blue")
+        self.layout["header"].update(Panel(header_text, border_style="blue"))
+    
+    def update_system_panel(self, cpu_info: Dict, mem_info: Dict):
+        """Refresh the system overview region."""
+        self.layout["system"].update(self.create_system_panel(cpu_info, mem_info))
+    
+    def update_process_table(self, processes: List[ProcRow]):
+        """Refresh the process table region."""
+        self.layout["processes"].update(self.create_process_table(processes))
+    
+    def update_network_table(self, net_info: NetInfo, connections: List[Dict]):
+        """Refresh the network statistics region."""
+        self.layout["network"].update(self.create_network_table(net_info, connections))
+    
+    def update_disk_table(self, disks: List[DiskRow]):
+        """Refresh the disk usage region."""
+        self.layout["disk"].update(self.create_disk_table(disks))
+    
     def run(self, sort_by: str = 'cpu', process_limit: int = 10, connection_limit: int = 10, 
             filter_process: Optional[str] = None):
         """Main monitoring loop."""
         def signal_handler(sig, frame):
+            # Let the render loop exit on its own; Live restores the terminal
             self.running = False
-            console.print("\n[bold red]Shutting down...[/bold red]")
-            sys.exit(0)
+            self._wakeup.set()
         
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
-        # Initialize network speed calculation
-        try:
-            _ = psutil.net_io_counters()
-            self.last_net_time = time.time()
-        except Exception:
-            pass
+        self.layout = self.build_layout()
+        self._render_keys = {}
+        self._wakeup.clear()
+        sampler = _Sampler(self, sort_by, process_limit, connection_limit, filter_process)
+        sampler.start()
         
         try:
-            with Live(console=console, refresh_per_second=1/self.refresh_rate, screen=True) as live:
+            with Live(self.layout, console=console, auto_refresh=False, screen=True) as live:
                 while self.running:
-                    try:
-                        # Collect data
-                        cpu_info = self.get_cpu_info()
-                        mem_info = self.get_memory_info()
-                        processes = self.get_top_processes(limit=process_limit, sort_by=sort_by, 
-                                                          filter_name=filter_process)
-                        net_info = self.get_network_info()
-                        connections = self.get_network_connections(limit=connection_limit)
-                        disks = self.get_disk_info()
-                        
-                        # Update history
-                        self.cpu_history.append(cpu_info['percent'])
-                        self.memory_history.append(mem_info['percent'])
-                        
-                        # Generate and update layout
-                        layout = self.generate_layout(cpu_info, mem_info, processes, net_info, connections, disks)
-                        live.update(layout)
-                    except Exception as e:
-                        # Continue on errors to maintain real-time monitoring
-                        console.print(f"[dim red]Error: {e}[/dim red]")
+                    if sampler.error is not None:
+                        raise sampler.error
                     
-                    time.sleep(self.refresh_rate)
-        except KeyboardInterrupt:
-            self.running = False
-            console.print("\n[bold red]Monitoring stopped.[/bold red]")
+                    # Render the latest published samples; a region whose first
+                    # sample failed keeps its placeholder until a retry succeeds
+                    data = sampler.snapshot()
+                    self.update_header()
+                    cpu_info, mem_info = data.get('cpu_info'), data.get('mem_info')
+                    if cpu_info is not None and mem_info is not None:
+                        system_key = (round(cpu_info['percent'], 1), round(cpu_info['frequency']),
+                                      round(mem_info['percent'], 1), round(mem_info['swap_percent'], 1))
+                        if self._is_dirty('system', system_key):
+                            self.update_system_panel(cpu_info, mem_info)
+                    if 'processes' in data:
+                        self.update_process_table(data['processes'])
+                    if 'net_info' in data and self._is_dirty('network', data['net_info']):
+                        self.update_network_table(data['net_info'], data.get('connections', []))
+                    if 'disks' in data and self._is_dirty('disk', tuple((d.device, d.used) for d in data['disks'])):
+                        self.update_disk_table(data['disks'])
+                    # Auto-refresh is off, so this is the only render per tick
+                    live.refresh()
+                    
+                    # Wait on an event so a signal ends the wait immediately
+                    self._wakeup.wait(self.refresh_rate)
         except Exception as e:
+            # Live has already restored the terminal at this point
             console.print(f"\n[bold red]Fatal error: {e}[/bold red]")
             sys.exit(1)
+        finally:
+            sampler.stop()
+        
+        console.print("\n[bold red]Monitoring stopped.[/bold red]")
 
 
 @click.command()
-@click.option('--refresh', '-r', default=1.0, type=float, help='Refresh rate in seconds (default: 1.0)')
+@click.option('--refresh', '-r', default=1.0, type=click.FloatRange(min=0, min_open=True),
+              help='Refresh rate in seconds (default: 1.0)')
 @click.option('--sort', '-s', default='cpu', type=click.Choice(['cpu', 'memory']), 
               help='Sort processes by CPU or memory (default: cpu)')
 @click.option('--processes', '-p', default=10, type=int, 
@@ -445,14 +897,21 @@ class SystemMonitor:
               help='Number of network connections to display (default: 10)')
 @click.option('--filter', '-f', default=None, type=str,
               help='Filter processes by name (case-insensitive)')
-def main(refresh: float, sort: str, processes: int, connections: int, filter: Optional[str]):
+@click.option('--no-connections', is_flag=True, default=False,
+              help='Skip collecting network connections (the most expensive sample)')
+@click.option('--conn-interval', default=None, type=click.IntRange(min=1),
+              help='Sample network connections every N refreshes (default: every 2s)')
+def main(refresh: float, sort: str, processes: int, connections: int, filter: Optional[str],
+         no_connections: bool, conn_interval: Optional[int]):
     """Real-time System Monitor - A powerful command-line tool for system analysis."""
     console.print("[bold green]Starting System Monitor...[/bold green]")
     filter_text = f" | Filter: {filter}" if filter else ""
-    console.print(f"[dim]Refresh rate: {refresh}s | Sort by: {sort} | Processes: {processes} | Connections: {connections}{filter_text}[/dim]\n")
+    connections_text = "off" if no_connections else connections
+    console.print(f"[dim]Refresh rate: {refresh}s | Sort by: {sort} | Processes: {processes} | Connections: {connections_text}{filter_text}[/dim]\n")
     
     try:
-        monitor = SystemMonitor(refresh_rate=refresh)
+        monitor = SystemMonitor(refresh_rate=refresh, collect_connections=not no_connections,
+                                connection_interval=conn_interval)
         monitor.run(sort_by=sort, process_limit=processes, connection_limit=connections, 
                    filter_process=filter)
     except Exception as e: